@@ -1,14 +1,19 @@
 import streamlit as st
 import os
 import shutil
-from io import BytesIO
 import zipfile
 from pathlib import Path
 import json
+import wave
+import hashlib
+import tempfile
+import time
 
-from downloader import download_youtube
-from main import split_wav_file
-from pydub import AudioSegment
+from profiles import DEFAULT_PROFILE, OUTPUT_EXTENSIONS, OUTPUT_PROFILES
+
+# Heavy modules (yt_dlp, pydub, mutagen) are imported lazily on the code paths
+# that need them: Streamlit re-executes this script on every interaction, and
+# anything imported at the top is paid for on every cold start.
 
 
 # Page configuration
@@ -40,6 +45,104 @@ def load_metadata():
     return None
 
 
+def file_identity(path):
+    """Return a cache key that changes whenever the file at path changes."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@st.cache_data(show_spinner=False)
+def probe_duration(audio_path, identity):
+    """Return the duration of an audio file formatted as H:MM:SS or M:SS."""
+    try:
+        # Reading the WAV header is much cheaper than decoding the whole file
+        with wave.open(audio_path, "rb") as wav_file:
+            duration_seconds = wav_file.getnframes() // wav_file.getframerate()
+    except (wave.Error, EOFError):
+        from pydub import AudioSegment
+
+        audio = AudioSegment.from_file(audio_path)
+        duration_seconds = len(audio) // 1000
+
+    hours = duration_seconds // 3600
+    minutes = (duration_seconds % 3600) // 60
+    seconds = duration_seconds % 60
+
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+@st.cache_data(show_spinner=False)
+def load_image(image_path, identity):
+    """Read an image file once per file version for previews."""
+    with open(image_path, "rb") as f:
+        return f.read()
+
+
+@st.cache_data(show_spinner=False)
+def list_output_files(output_dir, identity):
+    """List the exported tracks in output_dir, sorted by name."""
+    return [
+        str(f)
+        for f in sorted(Path(output_dir).iterdir())
+        if f.suffix.lstrip(".") in OUTPUT_EXTENSIONS
+    ]
+
+
+# Archives not used by any session for this long are removed
+ZIP_MAX_AGE_SECONDS = 60 * 60
+
+
+def write_zip(identities, zip_path):
+    """Write the ZIP archive for the given output files to zip_path."""
+    zip_dir = os.path.dirname(zip_path)
+    os.makedirs(zip_dir, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=zip_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for file_path, _, _ in identities:
+                    zip_file.write(file_path, os.path.basename(file_path))
+        os.replace(temp_path, zip_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    # Remove stale archives (and temp files of crashed writes) from other output sets
+    cutoff = time.time() - ZIP_MAX_AGE_SECONDS
+    for old_file in Path(zip_dir).iterdir():
+        try:
+            if str(old_file) != zip_path and old_file.stat().st_mtime < cutoff:
+                old_file.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def open_zip(identities):
+    """Open the ZIP archive for the given output files, writing it on first use."""
+    digest = hashlib.sha1(repr(identities).encode("utf-8")).hexdigest()[:16]
+    zip_path = os.path.join("data", "zips", f"{digest}.zip")
+
+    try:
+        zip_file = open(zip_path, "rb")
+    except FileNotFoundError:
+        write_zip(identities, zip_path)
+        zip_file = open(zip_path, "rb")
+
+    # Mark the archive as in use so it is not pruned as stale. If another
+    # session pruned it meanwhile, the open handle stays readable.
+    try:
+        os.utime(zip_path)
+    except FileNotFoundError:
+        pass
+    return zip_file
+
+
 def restore_session_from_files():
     """Restore session state from existing files in data/ directory."""
     data_dir = "data"
@@ -53,16 +156,7 @@ def restore_session_from_files():
     if os.path.exists(audio_path):
         try:
             # Get audio duration
-            audio = AudioSegment.from_file(audio_path)
-            duration_seconds = len(audio) // 1000
-            hours = duration_seconds // 3600
-            minutes = (duration_seconds % 3600) // 60
-            seconds = duration_seconds % 60
-
-            if hours > 0:
-                duration = f"{hours}:{minutes:02d}:{seconds:02d}"
-            else:
-                duration = f"{minutes}:{seconds:02d}"
+            duration = probe_duration(audio_path, file_identity(audio_path))
 
             # Restore metadata if available
             if metadata:
@@ -92,9 +186,9 @@ def restore_session_from_files():
 
     for output_dir in output_dirs:
         if os.path.exists(output_dir):
-            mp3_files = sorted(list(Path(output_dir).glob("*.mp3")))
-            if mp3_files:
-                st.session_state.output_files = [str(f) for f in mp3_files]
+            track_files = list_output_files(output_dir, file_identity(output_dir))
+            if track_files:
+                st.session_state.output_files = track_files
                 st.session_state.processing_complete = True
                 break
 
@@ -112,6 +206,8 @@ if "artist" not in st.session_state:
     st.session_state.artist = ""
 if "album" not in st.session_state:
     st.session_state.album = ""
+if "custom_cover_key" not in st.session_state:
+    st.session_state.custom_cover_key = None
 if "session_restored" not in st.session_state:
     st.session_state.session_restored = False
 
@@ -138,6 +234,8 @@ youtube_url = st.text_input(
 if st.button("Download Audio & Thumbnail", type="primary", disabled=not youtube_url):
     with st.spinner("Downloading from YouTube..."):
         try:
+            from downloader import download_youtube
+
             # Download the video
             info = download_youtube(youtube_url, output_dir="data")
             st.session_state.video_info = info
@@ -173,11 +271,11 @@ if st.session_state.downloaded and st.session_state.video_info:
 
     with col1:
         st.markdown("**Downloaded Cover**")
-        if st.session_state.video_info.get("cover_path") and os.path.exists(
-            st.session_state.video_info["cover_path"]
-        ):
+        cover_path = st.session_state.video_info.get("cover_path")
+        cover_identity = file_identity(cover_path) if cover_path else None
+        if cover_identity:
             st.image(
-                st.session_state.video_info["cover_path"],
+                load_image(cover_path, cover_identity),
                 width=300,
                 caption="YouTube Thumbnail",
             )
@@ -193,16 +291,19 @@ if st.session_state.downloaded and st.session_state.video_info:
         )
 
         if uploaded_cover is not None:
-            # Save uploaded cover
             custom_cover_path = os.path.join("data", "custom_cover.jpg")
-            with open(custom_cover_path, "wb") as f:
-                f.write(uploaded_cover.getbuffer())
+
+            # Save uploaded cover only when a new file is uploaded, not on every rerun
+            if st.session_state.custom_cover_key != uploaded_cover.file_id:
+                with open(custom_cover_path, "wb") as f:
+                    f.write(uploaded_cover.getbuffer())
+                st.session_state.custom_cover_key = uploaded_cover.file_id
 
             # Update session state to use custom cover
             st.session_state.video_info["cover_path"] = custom_cover_path
 
             # Show preview
-            st.image(custom_cover_path, width=300, caption="Custom Cover")
+            st.image(uploaded_cover.getvalue(), width=300, caption="Custom Cover")
             st.success("✓ Custom cover uploaded!")
 
 st.divider()
@@ -248,6 +349,18 @@ output_folder = st.text_input(
     help="Name of the folder where tracks will be saved",
 )
 
+# Output format
+output_profile = st.selectbox(
+    "Output Format",
+    options=list(OUTPUT_PROFILES),
+    index=list(OUTPUT_PROFILES).index(DEFAULT_PROFILE),
+    format_func=lambda name: OUTPUT_PROFILES[name]["label"],
+    help="\n".join(
+        f"- **{profile['label']}**: {profile['description']}"
+        for profile in OUTPUT_PROFILES.values()
+    ),
+)
+
 st.divider()
 
 # Split tracks button
@@ -269,6 +382,8 @@ if st.button("Split Tracks", type="primary", disabled=not can_split):
             status_text.text(f"Exporting {current}/{total}: {track_name}")
 
         try:
+            from main import split_wav_file
+
             # Split the audio file
             audio_path = st.session_state.video_info["audio_path"]
             cover_path = st.session_state.video_info.get("cover_path")
@@ -283,6 +398,7 @@ if st.button("Split Tracks", type="primary", disabled=not can_split):
                 output_dir=output_dir,
                 cover_art_path=cover_path,
                 progress_callback=progress_callback,
+                profile=output_profile,
             )
 
             st.session_state.output_files = created_files
@@ -307,25 +423,22 @@ if st.session_state.processing_complete and st.session_state.output_files:
     col1, col2 = st.columns(2)
 
     with col1:
-        # Create ZIP file for download
-        def create_zip():
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                for file_path in st.session_state.output_files:
-                    if os.path.exists(file_path):
-                        zip_file.write(file_path, os.path.basename(file_path))
-            zip_buffer.seek(0)
-            return zip_buffer
-
-        if st.session_state.output_files:
-            zip_data = create_zip()
-            st.download_button(
-                label="Download All (ZIP)",
-                data=zip_data,
-                file_name=f"{album.replace(' ', '_')}_tracks.zip",
-                mime="application/zip",
-                type="primary",
-            )
+        # Create ZIP file for download (written once per set of output files)
+        identities = tuple(
+            identity
+            for identity in map(file_identity, st.session_state.output_files)
+            if identity
+        )
+
+        if identities:
+            with open_zip(identities) as zip_data:
+                st.download_button(
+                    label="Download All (ZIP)",
+                    data=zip_data,
+                    file_name=f"{album.replace(' ', '_')}_tracks.zip",
+                    mime="application/zip",
+                    type="primary",
+                )
 
     with col2:
         # Delete all files button
@@ -334,12 +447,14 @@ if st.session_state.processing_complete and st.session_state.output_files:
                 # Delete the data directory
                 if os.path.exists("data"):
                     shutil.rmtree("data")
+                st.cache_data.clear()
 
                 # Reset session state
                 st.session_state.downloaded = False
                 st.session_state.video_info = None
                 st.session_state.processing_complete = False
                 st.session_state.output_files = []
+                st.session_state.custom_cover_key = None
 
                 st.success("✓ All files deleted successfully")
                 st.rerun()
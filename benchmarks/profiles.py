@@ -0,0 +1,130 @@
+"""
+Benchmark encode speed and output size of each output profile.
+
+Splits the same source audio into tracks once per profile with
+split_wav_file, including tagging and cover art, and reports wall time,
+realtime factor and total output size relative to the default profile.
+
+Without --source a synthetic signal (tones plus noise) is generated, which
+is harder to compress than silence but not representative of music; pass a
+real WAV file for meaningful size numbers.
+
+Usage:
+    uv run python benchmarks/profiles.py [--source mix.wav] [--duration 180]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import split_wav_file  # noqa: E402
+from profiles import DEFAULT_PROFILE, OUTPUT_PROFILES  # noqa: E402
+
+
+def create_source(path, duration_seconds):
+    """Write a stereo test signal to path."""
+    from pydub.generators import Sine, WhiteNoise
+
+    duration_ms = duration_seconds * 1000
+    signal = WhiteNoise().to_audio_segment(duration=duration_ms, volume=-30)
+    for freq, volume in [(110, -12), (440, -18), (1760, -24)]:
+        signal = signal.overlay(
+            Sine(freq).to_audio_segment(duration=duration_ms, volume=volume)
+        )
+    signal.set_channels(2).set_frame_rate(44100).export(path, format="wav")
+
+
+def create_cover(path):
+    """Write a YouTube-thumbnail-sized JPEG to path."""
+    from PIL import Image
+
+    Image.new("RGB", (1280, 720), (40, 80, 120)).save(path, "JPEG")
+
+
+def build_tracklist(duration_seconds, track_count):
+    """Build a tracklist splitting the source into equal-length tracks."""
+    step = duration_seconds // track_count
+    lines = []
+    for i in range(track_count):
+        start = i * step
+        lines.append(f"{start // 60:02d}:{start % 60:02d} - Track {i + 1}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark encode speed and output size of each output profile."
+    )
+    parser.add_argument("--source", help="Path to a WAV file to split.")
+    parser.add_argument(
+        "--duration",
+        type=int,
+        default=180,
+        help="Length of the synthetic source in seconds (default: 180).",
+    )
+    parser.add_argument(
+        "--tracks", type=int, default=3, help="Number of tracks (default: 3)."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = args.source
+        if not source:
+            source = os.path.join(workdir, "input.wav")
+            create_source(source, args.duration)
+
+        from pydub import AudioSegment
+
+        duration_seconds = len(AudioSegment.from_file(source)) // 1000
+        tracklist = build_tracklist(duration_seconds, args.tracks)
+
+        cover = os.path.join(workdir, "cover.jpg")
+        create_cover(cover)
+
+        results = {}
+        for name in OUTPUT_PROFILES:
+            output_dir = os.path.join(workdir, name)
+            start = time.perf_counter()
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    created_files = split_wav_file(
+                        source,
+                        tracklist,
+                        "Bench",
+                        "Bench",
+                        output_dir=output_dir,
+                        cover_art_path=cover,
+                        profile=name,
+                    )
+            except Exception as e:
+                # e.g. CouldntEncodeError when ffmpeg lacks the encoder
+                print(f"{name}: failed, skipping. Error: {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            if not created_files:
+                print(f"{name}: no files created, skipping.")
+                continue
+            size = sum(os.path.getsize(f) for f in created_files)
+            results[name] = (elapsed, size)
+
+    print(f"Source: {duration_seconds} s, {args.tracks} tracks")
+    print(f"{'Profile':<10} {'Time':>8} {'Speed':>8} {'Size':>9} {'vs default':>11}")
+    baseline_time, baseline_size = results.get(DEFAULT_PROFILE, (None, None))
+    for name, (elapsed, size) in results.items():
+        line = (
+            f"{name:<10} {elapsed:7.2f}s {duration_seconds / elapsed:7.1f}x "
+            f"{size / 1024 / 1024:7.2f}MB"
+        )
+        if baseline_size:
+            line += f" {size / baseline_size:10.0%}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark cold start and rerun cost of the Streamlit app.
+
+Runs app.py headlessly with Streamlit's AppTest against a synthetic data/
+directory (audio, cover, metadata and exported tracks), so the session
+restore, cover preview and ZIP download paths are all exercised. The default
+track set matches a one-hour mix exported at 320 kbps (15 tracks, ~140 MB).
+Each measurement runs in a fresh interpreter to capture real import cost.
+
+For comparison with the previous app.py, it also reports what that version
+paid on every cold start (eager yt_dlp/pydub/mutagen imports) and on every
+rerun (rebuilding the ZIP archive in memory).
+
+Usage:
+    uv run python benchmarks/startup.py [--reruns 20] [--duration 600] [--tracks 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+import zipfile
+from io import BytesIO
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["yt_dlp", "pydub", "mutagen"]
+
+TRACKLIST = """00:00 - Track 1
+03:24 - Track 2
+07:15 - Track 3"""
+
+# Import cost the previous app.py paid on every cold start: it imported
+# yt_dlp, pydub and main, and main imported mutagen at module level
+EAGER_IMPORT_CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import yt_dlp
+import pydub
+import mutagen.easyid3
+import mutagen.id3
+import main
+print(json.dumps({{"seconds": time.perf_counter() - start}}))
+"""
+
+APP_CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+first_run = time.perf_counter() - start
+
+at.text_area[0].input({tracklist!r}).run()
+
+reruns = []
+for _ in range({reruns}):
+    start = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - start)
+
+print(json.dumps({{
+    "first_run": first_run,
+    "reruns": reruns,
+    "exceptions": [str(e.value) for e in at.exception],
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def create_fixture(workdir, duration_seconds, track_count, track_bytes):
+    """Create a data/ directory that looks like a finished session."""
+    from PIL import Image
+
+    data_dir = os.path.join(workdir, "data")
+    output_dir = os.path.join(data_dir, "output_tracks")
+    os.makedirs(output_dir)
+
+    with wave.open(os.path.join(data_dir, "input.wav"), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(44100)
+        wav_file.writeframes(b"\0" * 4 * 44100 * duration_seconds)
+
+    Image.new("RGB", (1280, 720), (40, 80, 120)).save(
+        os.path.join(data_dir, "cover.jpg"), "JPEG"
+    )
+
+    with open(os.path.join(data_dir, "metadata.json"), "w", encoding="utf-8") as f:
+        json.dump({"artist": "Bench", "album": "Bench", "title": "Bench"}, f)
+
+    for i in range(1, track_count + 1):
+        with open(os.path.join(output_dir, f"{i:02d} - Track {i}.mp3"), "wb") as f:
+            f.write(os.urandom(track_bytes))
+
+
+def time_zip_rebuild(output_dir, runs):
+    """Time the in-memory ZIP rebuild the previous app.py did on every rerun."""
+    file_paths = sorted(
+        os.path.join(output_dir, name) for name in os.listdir(output_dir)
+    )
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        zip_buffer = BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for file_path in file_paths:
+                zip_file.write(file_path, os.path.basename(file_path))
+        zip_buffer.getvalue()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_child(code, cwd):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Streamlit cold start and rerun time for app.py."
+    )
+    parser.add_argument(
+        "--reruns", type=int, default=20, help="Number of timed reruns (default: 20)."
+    )
+    parser.add_argument(
+        "--duration",
+        type=int,
+        default=600,
+        help="Length of the synthetic input.wav in seconds (default: 600).",
+    )
+    parser.add_argument(
+        "--tracks",
+        type=int,
+        default=15,
+        help="Number of exported tracks (default: 15).",
+    )
+    parser.add_argument(
+        "--track-mb",
+        type=float,
+        default=9.6,
+        help="Size of each exported track in MB (default: 9.6, 4 min at 320 kbps).",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        create_fixture(
+            workdir, args.duration, args.tracks, int(args.track_mb * 1024 * 1024)
+        )
+
+        eager = run_child(EAGER_IMPORT_CHILD.format(root=REPO_ROOT), workdir)
+        app = run_child(
+            APP_CHILD.format(
+                root=REPO_ROOT,
+                app=os.path.join(REPO_ROOT, "app.py"),
+                tracklist=TRACKLIST,
+                reruns=args.reruns,
+                heavy=HEAVY_MODULES,
+            ),
+            workdir,
+        )
+        zip_rebuilds = time_zip_rebuild(
+            os.path.join(workdir, "data", "output_tracks"), min(args.reruns, 5)
+        )
+
+    reruns_ms = [t * 1000 for t in app["reruns"]]
+    rerun_median = statistics.median(reruns_ms)
+    rebuild_median = statistics.median(zip_rebuilds) * 1000
+    print("Previous app.py:")
+    print(f"  Eager imports per cold start:    {eager['seconds'] * 1000:8.1f} ms")
+    print(f"  ZIP rebuild per rerun:           {rebuild_median:8.1f} ms")
+    print(f"  Rerun median (estimated):        {rerun_median + rebuild_median:8.1f} ms")
+    print("Current app.py:")
+    print(f"  Cold start (first script run):   {app['first_run'] * 1000:8.1f} ms")
+    print(f"  Rerun median:                    {rerun_median:8.1f} ms")
+    print(f"  Rerun max:                       {max(reruns_ms):8.1f} ms")
+    print(f"  Heavy modules loaded by the UI:  {', '.join(app['heavy_loaded']) or 'none'}")
+    if app["exceptions"]:
+        print(f"App raised: {app['exceptions']}")
+
+
+if __name__ == "__main__":
+    main()
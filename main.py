@@ -1,10 +1,9 @@
 import os
-from pydub import AudioSegment
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import ID3, APIC
 import argparse
 import re
 
+from profiles import DEFAULT_PROFILE, OUTPUT_PROFILES, get_profile, write_tags
+
 
 def parse_time_to_ms(time_str):
     """Converts a MM:SS or HH:MM:SS string to milliseconds."""
@@ -42,17 +41,25 @@ def split_wav_file(
     output_dir="output_tracks",
     cover_art_path=None,
     progress_callback=None,
+    profile=DEFAULT_PROFILE,
 ):
     """
-    Splits a WAV file into multiple MP3 tracks based on a tracklist,
+    Splits a WAV file into multiple tracks based on a tracklist,
     and applies metadata and album art.
 
     Args:
         progress_callback: Optional callback function(current, total, track_name) for progress updates
+        profile: Name of the output profile (see profiles.OUTPUT_PROFILES)
 
     Returns:
-        List of paths to created MP3 files
+        List of paths to created track files
     """
+    # Imported here so importing main stays free of pydub/mutagen for callers
+    # that do not split
+    from pydub import AudioSegment
+
+    output_profile = get_profile(profile)
+
     try:
         # Load the audio file
         print(f"Loading audio file: {source_file}...")
@@ -90,6 +97,15 @@ def split_wav_file(
     # Track created files
     created_files = []
 
+    # Read the cover art once instead of for every track
+    cover_data = None
+    if cover_art_path:
+        try:
+            with open(cover_art_path, "rb") as art:
+                cover_data = art.read()
+        except Exception as e:
+            print(f"Warning: Could not read cover art. Error: {e}")
+
     # Determine end times and export each track
     for i, track in enumerate(tracks):
         start_ms = track["start_ms"]
@@ -100,7 +116,11 @@ def split_wav_file(
         track_num = i + 1
 
         # Sanitize title for the filename
-        safe_filename = re.sub(r'[\\/*?:"<>|]', "", f"{track_num:02d} - {title}.mp3")
+        safe_filename = re.sub(
+            r'[\\/*?:"<>|]',
+            "",
+            f"{track_num:02d} - {title}.{output_profile['extension']}",
+        )
         output_path = os.path.join(output_dir, safe_filename)
 
         print(f"[{track_num}/{len(tracks)}] Exporting: '{title}'...")
@@ -112,37 +132,32 @@ def split_wav_file(
         # Slice the audio
         track_audio = audio[start_ms:end_ms]
 
-        # Export as MP3 with metadata
+        # Export with the encoder settings of the selected profile
         track_audio.export(
             output_path,
-            format="mp3",
-            bitrate="320k",
-            tags={
-                "artist": artist_name,
-                "album": album_name,
-                "title": title,
-                "track": str(track_num),
-            },
+            format=output_profile["format"],
+            codec=output_profile["codec"],
+            bitrate=output_profile["bitrate"],
+            parameters=output_profile["parameters"],
         )
 
-        # Add album art using mutagen for better compatibility
-        if cover_art_path:
+        # Add metadata and album art using mutagen for better compatibility
+        try:
+            write_tags(
+                output_path,
+                {
+                    "artist": artist_name,
+                    "album": album_name,
+                    "title": title,
+                    "tracknumber": str(track_num),
+                },
+            )
+        except Exception as e:
+            print(f"   -> Warning: Could not add metadata. Error: {e}")
+
+        if cover_data:
             try:
-                audio_file = EasyID3(output_path)
-                audio_file.save()  # Save EasyID3 tags first
-
-                audio_file = ID3(output_path)
-                with open(cover_art_path, "rb") as art:
-                    audio_file.add(
-                        APIC(
-                            encoding=3,  # 3 is for utf-8
-                            mime="image/jpeg",  # image/jpeg or image/png
-                            type=3,  # 3 is for the cover (front) image
-                            desc="Cover",
-                            data=art.read(),
-                        )
-                    )
-                audio_file.save()
+                output_profile["write_cover"](output_path, cover_data)
                 print(f"   -> Added cover art to '{safe_filename}'")
             except Exception as e:
                 print(f"   -> Warning: Could not add cover art. Error: {e}")
@@ -156,7 +171,7 @@ def split_wav_file(
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Split a WAV file into multiple MP3 tracks with metadata based on a timestamp list."
+        description="Split a WAV file into multiple tracks with metadata based on a timestamp list."
     )
     parser.add_argument("source_file", help="Path to the source WAV file.")
     parser.add_argument("--artist", required=True, help="Artist name for the metadata.")
@@ -174,6 +189,12 @@ def main():
     parser.add_argument(
         "--cover", help="Path to an image file (e.g., cover.jpg) to embed as album art."
     )
+    parser.add_argument(
+        "--profile",
+        choices=OUTPUT_PROFILES,
+        default=DEFAULT_PROFILE,
+        help=f"Output format and encoder settings (default: '{DEFAULT_PROFILE}').",
+    )
 
     args = parser.parse_args()
 
@@ -194,6 +215,7 @@ def main():
         args.album,
         args.output_dir,
         args.cover,
+        profile=args.profile,
     )
 
 
@@ -0,0 +1,140 @@
+import base64
+
+
+def _image_mime(data):
+    """Guess the MIME type of cover art from its magic bytes."""
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def write_tags(output_path, tags):
+    """Writes artist/album/title/track tags using mutagen's easy interface."""
+    import mutagen
+
+    audio_file = mutagen.File(output_path, easy=True)
+    if audio_file.tags is None:
+        audio_file.add_tags()
+    for key, value in tags.items():
+        audio_file[key] = value
+    audio_file.save()
+
+
+def write_id3_cover(output_path, data):
+    """Embeds cover art as an ID3 APIC frame (MP3)."""
+    from mutagen.id3 import ID3, APIC
+
+    audio_file = ID3(output_path)
+    audio_file.add(
+        APIC(
+            encoding=3,  # 3 is for utf-8
+            mime=_image_mime(data),
+            type=3,  # 3 is for the cover (front) image
+            desc="Cover",
+            data=data,
+        )
+    )
+    audio_file.save()
+
+
+def write_mp4_cover(output_path, data):
+    """Embeds cover art as an MP4 covr atom (AAC/M4A)."""
+    from mutagen.mp4 import MP4, MP4Cover
+
+    mime = _image_mime(data)
+    if mime == "image/png":
+        image_format = MP4Cover.FORMAT_PNG
+    elif mime == "image/jpeg":
+        image_format = MP4Cover.FORMAT_JPEG
+    else:
+        # split_wav_file reports this as a warning and keeps the track
+        raise ValueError(f"MP4 cover art must be JPEG or PNG, not {mime}")
+
+    audio_file = MP4(output_path)
+    audio_file["covr"] = [MP4Cover(data, imageformat=image_format)]
+    audio_file.save()
+
+
+def write_vorbis_cover(output_path, data):
+    """Embeds cover art as a METADATA_BLOCK_PICTURE comment (Opus)."""
+    from mutagen.flac import Picture
+    from mutagen.oggopus import OggOpus
+
+    picture = Picture()
+    picture.type = 3  # 3 is for the cover (front) image
+    picture.mime = _image_mime(data)
+    picture.desc = "Cover"
+    picture.data = data
+
+    audio_file = OggOpus(output_path)
+    audio_file["metadata_block_picture"] = [
+        base64.b64encode(picture.write()).decode("ascii")
+    ]
+    audio_file.save()
+
+
+# Output profiles: encoder settings passed to pydub's export, the file
+# extension, and the mutagen writer used to embed cover art.
+OUTPUT_PROFILES = {
+    "mp3-320": {
+        "label": "MP3 320 kbps (CBR)",
+        "description": "Default, largest files",
+        "format": "mp3",
+        "extension": "mp3",
+        "codec": "libmp3lame",
+        "bitrate": "320k",
+        "parameters": [],
+        "write_cover": write_id3_cover,
+    },
+    "mp3-v2": {
+        "label": "MP3 VBR V2 (~190 kbps)",
+        "description": "Smaller files, same or less CPU than MP3 320 kbps",
+        "format": "mp3",
+        "extension": "mp3",
+        "codec": "libmp3lame",
+        "bitrate": None,
+        # LAME VBR quality 2 (V2) instead of a constant bitrate
+        "parameters": ["-q:a", "2"],
+        "write_cover": write_id3_cover,
+    },
+    "opus-160": {
+        "label": "Opus 160 kbps (VBR)",
+        "description": "Smallest files for the quality, more CPU than MP3",
+        "format": "opus",
+        "extension": "opus",
+        "codec": "libopus",
+        "bitrate": "160k",
+        # libopus defaults to compression_level 10; 3 needs far less CPU,
+        # but Opus still encodes slower than LAME
+        "parameters": ["-compression_level", "3"],
+        "write_cover": write_vorbis_cover,
+    },
+    "aac-192": {
+        "label": "AAC 192 kbps (M4A)",
+        "description": "Smaller files, less CPU than MP3 320 kbps",
+        "format": "ipod",
+        "extension": "m4a",
+        "codec": "aac",
+        "bitrate": "192k",
+        # The fast coder needs much less CPU than the default twoloop search
+        "parameters": ["-aac_coder", "fast"],
+        "write_cover": write_mp4_cover,
+    },
+}
+
+DEFAULT_PROFILE = "mp3-320"
+
+OUTPUT_EXTENSIONS = sorted({p["extension"] for p in OUTPUT_PROFILES.values()})
+
+
+def get_profile(name):
+    """Returns the output profile with the given name."""
+    try:
+        return OUTPUT_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown output profile '{name}'. "
+            f"Available profiles: {', '.join(OUTPUT_PROFILES)}"
+        )